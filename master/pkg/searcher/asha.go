@@ -30,6 +30,10 @@ type (
 		expconf.AsyncHalvingConfig
 		SmallerIsBetter bool
 		asyncHalvingSearchState
+
+		// promotionUnits[i] is the number of units a trial trains for when promoted from rung i
+		// to rung i+1. It depends only on the config, so it is not part of the snapshot.
+		promotionUnits []uint64
 	}
 
 	trialMetric struct {
@@ -45,8 +49,11 @@ type (
 		Metrics       []trialMetric `json:"metrics"`
 		StartTrials   int           `json:"start_trials"`
 		PromoteTrials int           `json:"promote_trials"`
-		// field below used by asha.go.
+		// fields below used by asha.go.
 		OutstandingTrials int `json:"outstanding_trials"`
+		// pendingClose holds trials added to this rung without being promoted that have not yet
+		// been handled by closeOutRungs. It is rebuilt from Metrics on restore.
+		pendingClose []model.RequestID
 	}
 )
 
@@ -63,9 +70,16 @@ func newAsyncHalvingSearch(config expconf.AsyncHalvingConfig, smallerIsBetter bo
 		rungs = append(rungs, &rung{UnitsNeeded: unitsNeeded})
 	}
 
+	var promotionUnits []uint64
+	for id := 0; id < len(rungs)-1; id++ {
+		promotionUnits = append(promotionUnits,
+			mathx.Max(rungs[id+1].UnitsNeeded-rungs[id].UnitsNeeded, 1))
+	}
+
 	return &asyncHalvingSearch{
 		AsyncHalvingConfig: config,
 		SmallerIsBetter:    smallerIsBetter,
+		promotionUnits:     promotionUnits,
 		asyncHalvingSearchState: asyncHalvingSearchState{
 			Rungs:            rungs,
 			TrialRungs:       make(map[model.RequestID]int),
@@ -81,7 +95,18 @@ func (s *asyncHalvingSearch) Snapshot() (json.RawMessage, error) {
 }
 
 func (s *asyncHalvingSearch) Restore(state json.RawMessage) error {
-	return json.Unmarshal(state, &s.asyncHalvingSearchState)
+	if err := json.Unmarshal(state, &s.asyncHalvingSearchState); err != nil {
+		return err
+	}
+	for _, rung := range s.Rungs {
+		rung.pendingClose = nil
+		for _, trialMetric := range rung.Metrics {
+			if !trialMetric.Promoted && !s.ClosedTrials[trialMetric.RequestID] {
+				rung.pendingClose = append(rung.pendingClose, trialMetric.RequestID)
+			}
+		}
+	}
+	return nil
 }
 
 // promotions handles bookkeeping of validation metrics and returns a RequestID to promote if
@@ -117,10 +142,12 @@ func (r *rung) promotionsAsync(
 	case promoteNow:
 		return []model.RequestID{requestID}
 	case numPromote != oldNumPromote && !r.Metrics[oldNumPromote].Promoted:
+		r.pendingClose = append(r.pendingClose, requestID)
 		t := &r.Metrics[oldNumPromote]
 		t.Promoted = true
 		return []model.RequestID{t.RequestID}
 	default:
+		r.pendingClose = append(r.pendingClose, requestID)
 		return nil
 	}
 }
@@ -188,28 +215,33 @@ func (s *asyncHalvingSearch) promoteAsync(
 ) []Operation {
 	// Upon a validation complete, we should return at least one more train&val workload
 	// unless the bracket of successive halving is finished.
-	rungIndex := s.TrialRungs[requestID]
-	rung := s.Rungs[rungIndex]
-	rung.OutstandingTrials--
+	var ops []Operation
 	addedTrainWorkload := false
+	for promoting := true; promoting; {
+		promoting = false
+		rungIndex := s.TrialRungs[requestID]
+		rung := s.Rungs[rungIndex]
+		rung.OutstandingTrials--
 
-	var ops []Operation
-	// If the trial has completed the top rung's validation, close the trial.
-	if rungIndex == s.NumRungs()-1 {
-		rung.Metrics = append(rung.Metrics,
-			trialMetric{
-				RequestID: requestID,
-				Metric:    metric,
-			},
-		)
+		// If the trial has completed the top rung's validation, close the trial.
+		if rungIndex == s.NumRungs()-1 {
+			rung.Metrics = append(rung.Metrics,
+				trialMetric{
+					RequestID: requestID,
+					Metric:    metric,
+				},
+			)
 
-		if !s.EarlyExitTrials[requestID] {
-			ops = append(ops, NewClose(requestID))
-			s.ClosedTrials[requestID] = true
+			if !s.EarlyExitTrials[requestID] {
+				ops = append(ops, NewClose(requestID))
+				s.ClosedTrials[requestID] = true
+			}
+			break
 		}
-	} else {
+
 		// This is not the top rung, so do promotions to the next rung.
 		nextRung := s.Rungs[rungIndex+1]
+		unitsNeeded := s.promotionUnits[rungIndex]
 		for _, promotionID := range rung.promotionsAsync(
 			requestID,
 			metric,
@@ -218,15 +250,16 @@ func (s *asyncHalvingSearch) promoteAsync(
 			s.TrialRungs[promotionID] = rungIndex + 1
 			nextRung.OutstandingTrials++
 			if !s.EarlyExitTrials[promotionID] {
-				unitsNeeded := mathx.Max(nextRung.UnitsNeeded-rung.UnitsNeeded, 1)
 				ops = append(ops, NewValidateAfter(promotionID, unitsNeeded))
 				addedTrainWorkload = true
 				s.PendingTrials++
 			} else {
-				// We make a recursive call that will behave the same
-				// as if we'd actually run the promoted job and received
-				// the worse possible result in return.
-				return s.promoteAsync(ctx, promotionID, ashaExitedMetricValue)
+				// Go around again with the promoted trial, which will behave the same
+				// as if we'd actually run the promoted job and received the worse
+				// possible result in return.
+				requestID, metric = promotionID, ashaExitedMetricValue
+				promoting = true
+				break
 			}
 		}
 	}
@@ -249,21 +282,24 @@ func (s *asyncHalvingSearch) promoteAsync(
 }
 
 // closeOutRungs closes all remaining unpromoted trials in any rungs that have no more outstanding
-// trials.
+// trials. Only trials added to a rung since its last close out are considered.
 func (s *asyncHalvingSearch) closeOutRungs() []Operation {
 	var ops []Operation
-	for _, rung := range s.Rungs {
+	for rungIndex, rung := range s.Rungs {
 		if rung.OutstandingTrials > 0 {
 			break
 		}
-		for _, trialMetric := range rung.Metrics {
-			if !trialMetric.Promoted && !s.ClosedTrials[trialMetric.RequestID] {
-				if !s.EarlyExitTrials[trialMetric.RequestID] {
-					ops = append(ops, NewClose(trialMetric.RequestID))
-					s.ClosedTrials[trialMetric.RequestID] = true
+		for _, requestID := range rung.pendingClose {
+			// A trial has been promoted out of this rung iff it has since moved to a higher one.
+			promoted := s.TrialRungs[requestID] > rungIndex
+			if !promoted && !s.ClosedTrials[requestID] {
+				if !s.EarlyExitTrials[requestID] {
+					ops = append(ops, NewClose(requestID))
+					s.ClosedTrials[requestID] = true
 				}
 			}
 		}
+		rung.pendingClose = rung.pendingClose[:0]
 	}
 	return ops
 }